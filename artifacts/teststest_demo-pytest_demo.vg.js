@@ -0,0 +1 @@
+window.hilSpec = {"$schema": "https://vega.github.io/schema/vega-lite/v5.20.1.json", "config": {"view": {"continuousWidth": 300, "continuousHeight": 300}}, "width": "container", "height": 400, "params": [{"name": "zoom", "select": {"type": "interval", "encodings": ["x", "y"]}, "bind": "scales", "views": ["traces"]}], "layer": [{"name": "traces", "data": {"name": "trace_data"}, "mark": {"type": "line", "interpolate": "monotone", "point": true}, "encoding": {"x": {"field": "timestamp", "type": "temporal", "title": "Time", "axis": {"format": "%Y-%m-%d %H:%M:%S.%L", "labelAngle": -45, "tickCount": 10, "tickMinStep": 0.01}}, "y": {"field": "value", "type": "quantitative"}, "color": {"field": "trace", "type": "nominal"}, "tooltip": [{"field": "timestamp", "type": "temporal", "title": "Time"}, {"field": "trace", "type": "nominal", "title": "Trace"}, {"field": "value", "type": "quantitative", "title": "Value"}]}}, {"data": {"name": "log_data"}, "mark": {"type": "tick", "thickness": 6}, "encoding": {"x": {"field": "timestamp", "type": "temporal", "title": "Time"}, "y": {"value": 0}, "color": {"field": "log_level", "type": "nominal", "title": "Level"}, "tooltip": [{"field": "log_level", "type": "nominal", "title": "Level"}, {"field": "message", "type": "nominal", "title": "Message"}, {"field": "timestamp", "type": "temporal", "format": "%Y-%m-%d %H:%M:%S.%L", "title": "Log Time"}]}}], "title": "tests/test_demo.py::test_demo", "datasets": {"trace_data": [{"timestamp": "2026-10-15T23:17:33.569", "trace": "source_1", "value": 1.0}, {"timestamp": "2026-10-15T23:17:33.580", "trace": "source_1", "value": 2.0}, {"timestamp": "2026-10-15T23:17:33.580", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:33.590", "trace": "source_1", "value": 3.0}, {"timestamp": "2026-10-15T23:17:33.601", "trace": "source_1", "value": 4.0}, {"timestamp": "2026-10-15T23:17:33.601", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:33.611", "trace": "source_1", "value": 5.0}, {"timestamp": "2026-10-15T23:17:33.621", "trace": "source_1", "value": 6.0}, {"timestamp": "2026-10-15T23:17:33.621", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:33.631", "trace": "source_1", "value": 7.0}, {"timestamp": "2026-10-15T23:17:33.642", "trace": "source_1", "value": 8.0}, {"timestamp": "2026-10-15T23:17:33.642", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:33.652", "trace": "source_1", "value": 9.0}, {"timestamp": "2026-10-15T23:17:33.662", "trace": "source_1", "value": 10.0}, {"timestamp": "2026-10-15T23:17:33.662", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:33.672", "trace": "source_1", "value": 10.0}, {"timestamp": "2026-10-15T23:17:33.683", "trace": "source_1", "value": 10.0}, {"timestamp": "2026-10-15T23:17:33.683", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:33.693", "trace": "source_1", "value": 10.0}, {"timestamp": "2026-10-15T23:17:33.703", "trace": "source_1", "value": 10.0}, {"timestamp": "2026-10-15T23:17:33.703", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:33.713", "trace": "source_1", "value": 10.0}, {"timestamp": "2026-10-15T23:17:33.724", "trace": "source_1", "value": 10.0}, {"timestamp": "2026-10-15T23:17:33.724", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:33.734", "trace": "source_1", "value": 10.0}, {"timestamp": "2026-10-15T23:17:33.744", "trace": "source_1", "value": 10.0}, {"timestamp": "2026-10-15T23:17:33.744", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:33.754", "trace": "source_1", "value": 10.0}, {"timestamp": "2026-10-15T23:17:33.764", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:33.785", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:33.805", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:33.825", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:33.845", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:33.866", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:33.886", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:33.906", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:33.926", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:33.947", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:33.967", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:33.987", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:34.007", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:34.028", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:34.048", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:34.069", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:34.089", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:34.110", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:34.130", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:34.151", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:34.171", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:34.191", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:34.212", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:34.232", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:34.253", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:34.273", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:34.294", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:34.315", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:34.335", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:34.356", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:34.377", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:34.397", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:34.418", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:34.438", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:34.459", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:34.480", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:34.501", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:34.521", "trace": "source_2", "value": 2.0}, {"timestamp": "2026-10-15T23:17:34.542", "trace": "source_2", "value": 2.0}], "log_data": [{"timestamp": "2026-10-15T23:17:33.570093", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.570039"}, {"timestamp": "2026-10-15T23:17:33.580498", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.580477"}, {"timestamp": "2026-10-15T23:17:33.580579", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.580571"}, {"timestamp": "2026-10-15T23:17:33.590782", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.590768"}, {"timestamp": "2026-10-15T23:17:33.601182", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.601142"}, {"timestamp": "2026-10-15T23:17:33.601326", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.601318"}, {"timestamp": "2026-10-15T23:17:33.611534", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.611520"}, {"timestamp": "2026-10-15T23:17:33.621757", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.621745"}, {"timestamp": "2026-10-15T23:17:33.621817", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.621810"}, {"timestamp": "2026-10-15T23:17:33.631997", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.631987"}, {"timestamp": "2026-10-15T23:17:33.642239", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.642224"}, {"timestamp": "2026-10-15T23:17:33.642312", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.642305"}, {"timestamp": "2026-10-15T23:17:33.652473", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.652465"}, {"timestamp": "2026-10-15T23:17:33.662672", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.662661"}, {"timestamp": "2026-10-15T23:17:33.662730", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.662724"}, {"timestamp": "2026-10-15T23:17:33.672934", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.672920"}, {"timestamp": "2026-10-15T23:17:33.683230", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.683219"}, {"timestamp": "2026-10-15T23:17:33.683281", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.683275"}, {"timestamp": "2026-10-15T23:17:33.693441", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.693433"}, {"timestamp": "2026-10-15T23:17:33.703650", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.703638"}, {"timestamp": "2026-10-15T23:17:33.703706", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.703700"}, {"timestamp": "2026-10-15T23:17:33.713890", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.713878"}, {"timestamp": "2026-10-15T23:17:33.724118", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.724104"}, {"timestamp": "2026-10-15T23:17:33.724185", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.724178"}, {"timestamp": "2026-10-15T23:17:33.734353", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.734342"}, {"timestamp": "2026-10-15T23:17:33.744548", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.744540"}, {"timestamp": "2026-10-15T23:17:33.744597", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.744591"}, {"timestamp": "2026-10-15T23:17:33.754768", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.754759"}, {"timestamp": "2026-10-15T23:17:33.764958", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.764949"}, {"timestamp": "2026-10-15T23:17:33.785127", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.785117"}, {"timestamp": "2026-10-15T23:17:33.805460", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.805425"}, {"timestamp": "2026-10-15T23:17:33.825719", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.825707"}, {"timestamp": "2026-10-15T23:17:33.846095", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.846059"}, {"timestamp": "2026-10-15T23:17:33.866381", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.866369"}, {"timestamp": "2026-10-15T23:17:33.886586", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.886573"}, {"timestamp": "2026-10-15T23:17:33.906784", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.906773"}, {"timestamp": "2026-10-15T23:17:33.926986", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.926971"}, {"timestamp": "2026-10-15T23:17:33.947175", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.947167"}, {"timestamp": "2026-10-15T23:17:33.967507", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.967477"}, {"timestamp": "2026-10-15T23:17:33.987794", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:33.987775"}, {"timestamp": "2026-10-15T23:17:34.008039", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:34.008019"}, {"timestamp": "2026-10-15T23:17:34.028282", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:34.028263"}, {"timestamp": "2026-10-15T23:17:34.048700", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:34.048664"}, {"timestamp": "2026-10-15T23:17:34.069231", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:34.069185"}, {"timestamp": "2026-10-15T23:17:34.089879", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:34.089833"}, {"timestamp": "2026-10-15T23:17:34.110374", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:34.110333"}, {"timestamp": "2026-10-15T23:17:34.130875", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:34.130832"}, {"timestamp": "2026-10-15T23:17:34.151291", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:34.151254"}, {"timestamp": "2026-10-15T23:17:34.171616", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:34.171593"}, {"timestamp": "2026-10-15T23:17:34.191964", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:34.191932"}, {"timestamp": "2026-10-15T23:17:34.212484", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:34.212440"}, {"timestamp": "2026-10-15T23:17:34.233002", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:34.232958"}, {"timestamp": "2026-10-15T23:17:34.253556", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:34.253512"}, {"timestamp": "2026-10-15T23:17:34.274142", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:34.274095"}, {"timestamp": "2026-10-15T23:17:34.294698", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:34.294637"}, {"timestamp": "2026-10-15T23:17:34.315419", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:34.315354"}, {"timestamp": "2026-10-15T23:17:34.336101", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:34.336051"}, {"timestamp": "2026-10-15T23:17:34.356689", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:34.356639"}, {"timestamp": "2026-10-15T23:17:34.377265", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:34.377222"}, {"timestamp": "2026-10-15T23:17:34.397825", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:34.397779"}, {"timestamp": "2026-10-15T23:17:34.418404", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:34.418360"}, {"timestamp": "2026-10-15T23:17:34.439045", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:34.438996"}, {"timestamp": "2026-10-15T23:17:34.459851", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:34.459788"}, {"timestamp": "2026-10-15T23:17:34.480557", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:34.480502"}, {"timestamp": "2026-10-15T23:17:34.501183", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:34.501132"}, {"timestamp": "2026-10-15T23:17:34.521927", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:34.521880"}, {"timestamp": "2026-10-15T23:17:34.542530", "log_level": "INFO", "message": "something's ready! 2026-10-15 23:17:34.542484"}]}};
@@ -0,0 +1 @@
+window.hilSpec = {"$schema": "https://vega.github.io/schema/vega-lite/v5.20.1.json", "config": {"view": {"continuousWidth": 300, "continuousHeight": 300}}, "width": "container", "height": 400, "params": [{"name": "zoom", "select": {"type": "interval", "encodings": ["x", "y"]}, "bind": "scales", "views": ["traces"]}], "layer": [{"name": "traces", "data": {"name": "trace_data"}, "mark": {"type": "line", "interpolate": "monotone", "point": true}, "encoding": {"x": {"field": "timestamp", "type": "temporal", "title": "Time", "axis": {"format": "%Y-%m-%d %H:%M:%S.%L", "labelAngle": -45, "tickCount": 10, "tickMinStep": 0.01}}, "y": {"field": "value", "type": "quantitative"}, "color": {"field": "trace", "type": "nominal"}, "tooltip": [{"field": "timestamp", "type": "temporal", "title": "Time"}, {"field": "trace", "type": "nominal", "title": "Trace"}, {"field": "value", "type": "quantitative", "title": "Value"}]}}, {"data": {"name": "log_data"}, "mark": {"type": "tick", "thickness": 6}, "encoding": {"x": {"field": "timestamp", "type": "temporal", "title": "Time"}, "y": {"value": 0}, "color": {"field": "log_level", "type": "nominal", "title": "Level"}, "tooltip": [{"field": "log_level", "type": "nominal", "title": "Level"}, {"field": "message", "type": "nominal", "title": "Message"}, {"field": "timestamp", "type": "temporal", "format": "%Y-%m-%d %H:%M:%S.%L", "title": "Log Time"}]}}], "title": "tests/test_demo.py::test_demo_assert_always", "datasets": {"trace_data": [{"timestamp": "2026-10-15T23:17:34.914", "trace": "source_1", "value": 1.0}, {"timestamp": "2026-10-15T23:17:34.925", "trace": "source_1", "value": 2.0}, {"timestamp": "2026-10-15T23:17:34.936", "trace": "source_1", "value": 3.0}, {"timestamp": "2026-10-15T23:17:34.948", "trace": "source_1", "value": 4.0}, {"timestamp": "2026-10-15T23:17:34.959", "trace": "source_1", "value": 5.0}, {"timestamp": "2026-10-15T23:17:34.971", "trace": "source_1", "value": 6.0}, {"timestamp": "2026-10-15T23:17:34.983", "trace": "source_1", "value": 7.0}, {"timestamp": "2026-10-15T23:17:34.994", "trace": "source_1", "value": 8.0}, {"timestamp": "2026-10-15T23:17:35.006", "trace": "source_1", "value": 9.0}, {"timestamp": "2026-10-15T23:17:35.017", "trace": "source_1", "value": 10.0}, {"timestamp": "2026-10-15T23:17:35.029", "trace": "source_1", "value": 10.0}, {"timestamp": "2026-10-15T23:17:35.041", "trace": "source_1", "value": 10.0}, {"timestamp": "2026-10-15T23:17:35.052", "trace": "source_1", "value": 10.0}, {"timestamp": "2026-10-15T23:17:35.064", "trace": "source_1", "value": 10.0}, {"timestamp": "2026-10-15T23:17:35.075", "trace": "source_1", "value": 10.0}, {"timestamp": "2026-10-15T23:17:35.087", "trace": "source_1", "value": 10.0}, {"timestamp": "2026-10-15T23:17:35.098", "trace": "source_1", "value": 10.0}, {"timestamp": "2026-10-15T23:17:35.110", "trace": "source_1", "value": 10.0}, {"timestamp": "2026-10-15T23:17:35.121", "trace": "source_1", "value": 10.0}], "log_data": []}};
@@ -0,0 +1 @@
+window.hilSpec = {"$schema": "https://vega.github.io/schema/vega-lite/v5.20.1.json", "config": {"view": {"continuousWidth": 300, "continuousHeight": 300}}, "width": "container", "height": 400, "params": [{"name": "zoom", "select": {"type": "interval", "encodings": ["x", "y"]}, "bind": "scales", "views": ["traces"]}], "layer": [{"name": "traces", "data": {"name": "trace_data"}, "mark": {"type": "line", "interpolate": "monotone", "point": true}, "encoding": {"x": {"field": "timestamp", "type": "temporal", "title": "Time", "axis": {"format": "%Y-%m-%d %H:%M:%S.%L", "labelAngle": -45, "tickCount": 10, "tickMinStep": 0.01}}, "y": {"field": "value", "type": "quantitative"}, "color": {"field": "trace", "type": "nominal"}, "tooltip": [{"field": "timestamp", "type": "temporal", "title": "Time"}, {"field": "trace", "type": "nominal", "title": "Trace"}, {"field": "value", "type": "quantitative", "title": "Value"}]}}, {"data": {"name": "log_data"}, "mark": {"type": "tick", "thickness": 6}, "encoding": {"x": {"field": "timestamp", "type": "temporal", "title": "Time"}, "y": {"value": 0}, "color": {"field": "log_level", "type": "nominal", "title": "Level"}, "tooltip": [{"field": "log_level", "type": "nominal", "title": "Level"}, {"field": "message", "type": "nominal", "title": "Message"}, {"field": "timestamp", "type": "temporal", "format": "%Y-%m-%d %H:%M:%S.%L", "title": "Log Time"}]}}], "title": "tests/test_demo.py::test_record_approx_once_settled", "datasets": {"trace_data": [{"timestamp": "2026-10-15T23:17:35.129", "trace": "test_record_approx_once_settled.<locals>.decaying_source", "value": 0.0}, {"timestamp": "2026-10-15T23:17:35.133", "trace": "test_record_approx_once_settled.<locals>.decaying_source", "value": 3.1606027941427883}, {"timestamp": "2026-10-15T23:17:35.134", "trace": "test_record_approx_once_settled.<locals>.decaying_source", "value": 4.323323583816936}, {"timestamp": "2026-10-15T23:17:35.136", "trace": "test_record_approx_once_settled.<locals>.decaying_source", "value": 4.75106465816068}, {"timestamp": "2026-10-15T23:17:35.138", "trace": "test_record_approx_once_settled.<locals>.decaying_source", "value": 4.908421805556329}, {"timestamp": "2026-10-15T23:17:35.140", "trace": "test_record_approx_once_settled.<locals>.decaying_source", "value": 4.966310265004573}, {"timestamp": "2026-10-15T23:17:35.142", "trace": "test_record_approx_once_settled.<locals>.decaying_source", "value": 4.987606239116668}, {"timestamp": "2026-10-15T23:17:35.144", "trace": "test_record_approx_once_settled.<locals>.decaying_source", "value": 4.995440590172228}, {"timestamp": "2026-10-15T23:17:35.146", "trace": "test_record_approx_once_settled.<locals>.decaying_source", "value": 4.9983226868604875}, {"timestamp": "2026-10-15T23:17:35.148", "trace": "test_record_approx_once_settled.<locals>.decaying_source", "value": 4.999382950979567}, {"timestamp": "2026-10-15T23:17:35.150", "trace": "test_record_approx_once_settled.<locals>.decaying_source", "value": 4.999773000351188}, {"timestamp": "2026-10-15T23:17:35.152", "trace": "test_record_approx_once_settled.<locals>.decaying_source", "value": 4.999916491496049}, {"timestamp": "2026-10-15T23:17:35.154", "trace": "test_record_approx_once_settled.<locals>.decaying_source", "value": 4.9999692789382335}, {"timestamp": "2026-10-15T23:17:35.156", "trace": "test_record_approx_once_settled.<locals>.decaying_source", "value": 4.999988698352965}, {"timestamp": "2026-10-15T23:17:35.158", "trace": "test_record_approx_once_settled.<locals>.decaying_source", "value": 4.999995842356404}, {"timestamp": "2026-10-15T23:17:35.160", "trace": "test_record_approx_once_settled.<locals>.decaying_source", "value": 4.999998470488397}, {"timestamp": "2026-10-15T23:17:35.162", "trace": "test_record_approx_once_settled.<locals>.decaying_source", "value": 4.999999437324126}, {"timestamp": "2026-10-15T23:17:35.163", "trace": "test_record_approx_once_settled.<locals>.decaying_source", "value": 4.999999793003115}, {"timestamp": "2026-10-15T23:17:35.165", "trace": "test_record_approx_once_settled.<locals>.decaying_source", "value": 4.999999923850101}, {"timestamp": "2026-10-15T23:17:35.167", "trace": "test_record_approx_once_settled.<locals>.decaying_source", "value": 4.999999971986018}, {"timestamp": "2026-10-15T23:17:35.169", "trace": "test_record_approx_once_settled.<locals>.decaying_source", "value": 4.999999989694232}, {"timestamp": "2026-10-15T23:17:35.171", "trace": "test_record_approx_once_settled.<locals>.decaying_source", "value": 4.99999999620872}, {"timestamp": "2026-10-15T23:17:35.173", "trace": "test_record_approx_once_settled.<locals>.decaying_source", "value": 4.999999998605266}, {"timestamp": "2026-10-15T23:17:35.174", "trace": "test_record_approx_once_settled.<locals>.decaying_source", "value": 4.999999999486906}, {"timestamp": "2026-10-15T23:17:35.176", "trace": "test_record_approx_once_settled.<locals>.decaying_source", "value": 4.999999999811243}, {"timestamp": "2026-10-15T23:17:35.178", "trace": "test_record_approx_once_settled.<locals>.decaying_source", "value": 4.99999999993056}, {"timestamp": "2026-10-15T23:17:35.180", "trace": "test_record_approx_once_settled.<locals>.decaying_source", "value": 4.999999999974454}, {"timestamp": "2026-10-15T23:17:35.181", "trace": "test_record_approx_once_settled.<locals>.decaying_source", "value": 4.999999999990602}, {"timestamp": "2026-10-15T23:17:35.182", "trace": "test_record_approx_once_settled.<locals>.decaying_source", "value": 4.999999999996543}, {"timestamp": "2026-10-15T23:17:35.184", "trace": "test_record_approx_once_settled.<locals>.decaying_source", "value": 4.999999999998728}], "log_data": []}};
@@ -301,10 +301,13 @@ class ADS1x15:
 
     async def _request_input(self, input: InputConfig):
         "Private method for starting a single-shot conversion"
-        await self._set_input(input)
-        # Set single-shot conversion start (bit 15)
         if self._config & 0x0100:
+            # In single-shot mode, select the input and set the conversion start bit
+            # (bit 15) in the same write, rather than writing the config twice
+            self._config = (self._config & 0x8FFF) | (input << 12)
             await self._write_register(self.CONFIG_REG, self._config | 0x8000)
+        else:
+            await self._set_input(input)
 
     async def _get_adc(self) -> int:
         "Get ADC value with current configuration"
@@ -20,6 +20,9 @@ class TCA9548A:
         if self._current_channel == channel:
             return
 
+        # Forget the current channel until the write succeeds, since the mux is in
+        # an unknown state if it fails or is cancelled part way
+        self._current_channel = None
         value = 1 << channel
         await handle.write_byte(self.address, value)
         self._current_channel = channel
@@ -1,5 +1,6 @@
 import asyncio
 import collections.abc
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import polars as pl
 import logging
@@ -35,58 +36,83 @@ async def any_ready(
     It should keep yielding from them until ALL of them have been exhausted, unless
     one raises an exception (other than StopAsyncIteration).
     """
-    end_time = datetime.now() + timeout if timeout is not None else None
-    # Create an initial task for each async iterator's __anext__ call.
-    tasks = {asyncio.create_task(it.__anext__()): it for it in iterators}  # type: ignore
-    try:
-        # Continue until all iterators are exhausted.
-        while tasks:
-            # Wait until any of the scheduled tasks completes.
-            if end_time is None:
-                _timeout = None
-            else:
-                remaining_time = end_time - datetime.now()
-                if remaining_time <= ZERO_TIMEDELTA:
-                    return
-                _timeout = remaining_time.total_seconds()
-
-            done, _ = await asyncio.wait(
-                tasks.keys(),
-                return_when=asyncio.FIRST_COMPLETED,
-                timeout=_timeout,
-            )
-            for task in done:
-                it = tasks.pop(task)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout.total_seconds() if timeout is not None else None
+
+    # Each iterator is driven by one long-lived task, which reports to a shared queue.
+    # Items are the feeder's resume event when the iterator yields, or None and the
+    # exception (if any) when it stops
+    queue: asyncio.Queue[tuple[asyncio.Event | None, Exception | None]] = (
+        asyncio.Queue()
+    )
+
+    async def _feed(it: AsyncIterator):
+        resume = asyncio.Event()
+        try:
+            while True:
                 try:
-                    # Get the result (or handle StopAsyncIteration/other exceptions)
-                    task.result()
+                    await it.__anext__()
                 except StopAsyncIteration:
-                    # This iterator is exhausted, no rescheduling.
-                    continue
-                except Exception:
-                    # If an exception occurs, cancel all pending tasks and re-raise.
-                    for pending in tasks:
-                        pending.cancel()
-                    raise
-                else:
-                    # Yield as soon as any iterator yields a value.
-                    yield None
-                    # Re-schedule the iterator for its next value.
-                    tasks[asyncio.create_task(it.__anext__())] = it  # type: ignore
+                    break
+                queue.put_nowait((resume, None))
+                # Don't advance the iterator until the consumer is ready for more
+                await resume.wait()
+                resume.clear()
+        except Exception as e:
+            queue.put_nowait((None, e))
+        else:
+            queue.put_nowait((None, None))
+
+    feeders = [asyncio.create_task(_feed(it)) for it in iterators]
+    try:
+        # Continue until all iterators are exhausted.
+        remaining = len(feeders)
+        while remaining:
+            if deadline is not None and loop.time() >= deadline:
+                return
+            try:
+                async with asyncio.timeout_at(deadline):
+                    resume, exc = await queue.get()
+            except TimeoutError:
+                return
+
+            if exc is not None:
+                # If an exception occurs, the pending feeders are cancelled below
+                raise exc
+            if resume is None:
+                # This iterator is exhausted
+                remaining -= 1
+                continue
+
+            # Yield as soon as any iterator yields a value.
+            yield None
+            resume.set()
 
     finally:
-        for task in tasks:
-            task.cancel()
+        for feeder in feeders:
+            feeder.cancel()
 
 
 class Trace[T](collections.abc.AsyncIterator):
     TIMESTAMP_COLUMN = "timestamp"
+    # Initial capacity of the sample buffers, which double in size when full
+    INITIAL_CAPACITY = 256
 
     def __init__(self, name: str, data: pl.DataFrame | None = None):
         self._name = name
-        self._data: list[T] = []
-        self._timestamps: list[datetime] = []
+        # Samples are written into preallocated numpy buffers, rather than Python
+        # lists, so that they can be handed to polars without converting each one
+        self._data = np.empty(self.INITIAL_CAPACITY, dtype=np.float64)
+        self._timestamps = np.empty(self.INITIAL_CAPACITY, dtype="datetime64[us]")
+        # Whether each sample has a value, so missing (None) samples become nulls
+        self._valid = np.empty(self.INITIAL_CAPACITY, dtype=np.bool_)
+        self._length = 0
         self._polars: pl.DataFrame | None = data
+        # Track the time span as samples arrive, so `duration` doesn't need to scan
+        # the data. Traces derived from an existing frame fall back to polars
+        self._track_span = data is None
+        self._first_timestamp: datetime | None = None
+        self._last_timestamp: datetime | None = None
         self._closed = False
         self._result_future: asyncio.Future[T] | None = None
         self._schema = pl.Schema(
@@ -103,20 +129,44 @@ class Trace[T](collections.abc.AsyncIterator):
         if timestamp is None:
             timestamp = datetime.now()
 
-        self._timestamps.append(timestamp)
-        self._data.append(data)
+        if self._length == len(self._data):
+            self._data = np.resize(self._data, 2 * self._length)
+            self._timestamps = np.resize(self._timestamps, 2 * self._length)
+            self._valid = np.resize(self._valid, 2 * self._length)
+
+        self._timestamps[self._length] = timestamp
+        if data is None:
+            self._valid[self._length] = False
+        else:
+            self._valid[self._length] = True
+            self._data[self._length] = data
+        self._length += 1
+
+        if self._track_span:
+            if self._first_timestamp is None or timestamp < self._first_timestamp:
+                self._first_timestamp = timestamp
+            if self._last_timestamp is None or timestamp > self._last_timestamp:
+                self._last_timestamp = timestamp
 
         if self._result_future is not None:
             self._result_future.set_result(data)
             self._result_future = None
 
     def to_polars(self) -> pl.DataFrame:
+        values = pl.Series(self._name, self._data[: self._length])
+        missing = np.flatnonzero(~self._valid[: self._length])
+        if len(missing):
+            values = values.scatter(missing, None)
         new_df = pl.DataFrame(
-            {self.TIMESTAMP_COLUMN: self._timestamps, self._name: self._data},
-            schema=self._schema,
-        )
-        self._timestamps.clear()
-        self._data.clear()
+            [pl.Series(self.TIMESTAMP_COLUMN, self._timestamps[: self._length]), values]
+        ).cast(self._schema)
+
+        # The frame may share memory with the buffers, so start fresh ones
+        # rather than overwriting them
+        self._data = np.empty(self.INITIAL_CAPACITY, dtype=np.float64)
+        self._timestamps = np.empty(self.INITIAL_CAPACITY, dtype="datetime64[us]")
+        self._valid = np.empty(self.INITIAL_CAPACITY, dtype=np.bool_)
+        self._length = 0
 
         if self._polars is not None:
             self._polars = pl.concat([self._polars, new_df])
@@ -170,6 +220,9 @@ class Trace[T](collections.abc.AsyncIterator):
 
     @property
     def duration(self) -> timedelta:
+        if self._first_timestamp is not None and self._last_timestamp is not None:
+            return self._last_timestamp - self._first_timestamp
+
         max_timestamp = cast(datetime, self.timestamps.max())
         min_timestamp = cast(datetime, self.timestamps.min())
         return max_timestamp - min_timestamp
@@ -325,6 +378,7 @@ class record[T]:
         self.add_trace(self._trace)
         self._min_interval = min_interval
         self._last_timestamp: datetime | None = None
+        self._executor: ThreadPoolExecutor | None = None
 
     def __enter__(self) -> Trace[T]:
         self.start()
@@ -364,6 +418,8 @@ class record[T]:
 
             finally:
                 self._trace.close()
+                if self._executor is not None:
+                    self._executor.shutdown(wait=False)
 
         self._task = asyncio.create_task(_trace())
 
@@ -417,14 +473,21 @@ class record[T]:
         name: str | None = None,
         min_interval: timedelta | None = None,
     ) -> Self:
+        # Sync sources are typically blocking I/O on a single device, so give each
+        # record its own worker thread rather than submitting to the shared default
+        # executor for every sample
+        executor = ThreadPoolExecutor(max_workers=1)
+
         async def async_func() -> T:
-            return await asyncio.to_thread(func)
+            return await asyncio.get_running_loop().run_in_executor(executor, func)
 
-        return cls(
+        self = cls(
             async_func,
             name=name or func.__qualname__,
             min_interval=min_interval,
         )
+        self._executor = executor
+        return self
 
     @classmethod
     def from_async_generator(
@@ -453,6 +516,9 @@ Recorder = type[record]
 class Query:
     """
     Builds a polars query over values from a trace.
+
+    Queries are immutable; each operator returns a new Query wrapping the extended
+    expression, so a query can be safely reused across evaluations.
     """
 
     def __init__(self, trace: Trace, expr: pl.Expr | None = None):
@@ -463,27 +529,24 @@ class Query:
         self._expr = expr
         self._timestamp = trace.TIMESTAMP_COLUMN
 
-    def _evaluate(self) -> bool:
-        results = self.trace.to_polars().select(self._expr)
-
-        if results.shape[1] > 1:
-            raise ValueError("Query returned too many columns")
-
-        if results.dtypes[0] != pl.Boolean:
-            raise ValueError("Query returned non-boolean value(s)")
+    def compile(self) -> "CompiledQuery":
+        """
+        Validate the query against the trace's schema, returning a CompiledQuery
+        which can be cheaply evaluated as new data arrives.
+        """
+        return CompiledQuery(self.trace, self._expr)
 
-        if results.shape[0] != 1:
-            return results.get_column(results.columns[0]).any()
+    def _evaluate(self) -> bool:
+        return self.compile().evaluate()
 
-        return bool(results.item())
+    def _derive(self, expr: pl.Expr) -> Self:
+        return self.__class__(self.trace, expr)
 
     def __gt__(self, other: float) -> Self:
-        self._expr = self._expr > other
-        return self
+        return self._derive(self._expr > other)
 
     def __lt__(self, other: float) -> Self:
-        self._expr = self._expr < other
-        return self
+        return self._derive(self._expr < other)
 
     def __bool__(self) -> bool:
         return self._evaluate()
@@ -494,20 +557,18 @@ class Query:
         )
 
     def rolling_minimum(self, duration: timedelta) -> Self:
-        self._expr = (
-            (self)
-            ._after(duration)
-            .rolling_min_by(self._timestamp, window_size=duration, min_samples=2)
+        return self._derive(
+            self._after(duration).rolling_min_by(
+                self._timestamp, window_size=duration, min_samples=2
+            )
         )
-        return self
 
     def rolling_maximum(self, duration: timedelta) -> Self:
-        self._expr = (
-            (self)
-            ._after(duration)
-            .rolling_max_by(self._timestamp, window_size=duration, min_samples=2)
+        return self._derive(
+            self._after(duration).rolling_max_by(
+                self._timestamp, window_size=duration, min_samples=2
+            )
         )
-        return self
 
     def rolling_within_tolerance(
         self,
@@ -520,40 +581,40 @@ class Query:
         lower_bound = min(target * (1 - rel_tol), target - abs_tol)
         upper_bound = max(target * (1 + rel_tol), target + abs_tol)
 
-        self._expr = (
+        return self._derive(
             (
-                self._expr.rolling_min_by(
-                    self._timestamp, window_size=duration, min_samples=min_samples
+                (
+                    self._expr.rolling_min_by(
+                        self._timestamp, window_size=duration, min_samples=min_samples
+                    )
+                    > lower_bound
                 )
-                > lower_bound
-            )
-            & (
-                self._expr.rolling_max_by(
-                    self._timestamp, window_size=duration, min_samples=min_samples
+                & (
+                    self._expr.rolling_max_by(
+                        self._timestamp, window_size=duration, min_samples=min_samples
+                    )
+                    < upper_bound
                 )
-                < upper_bound
+            ).filter(
+                (pl.col(self._timestamp).max() - pl.col(self._timestamp).min())
+                >= duration
             )
-        ).filter(
-            (pl.col(self._timestamp).max() - pl.col(self._timestamp).min()) >= duration
         )
 
-        return self
-
     def any(self) -> Self:
-        self._expr = self._expr.any()
-        return self
+        return self._derive(self._expr.any())
 
     def all(self) -> Self:
-        self._expr = self._expr.all()
-        return self
+        return self._derive(self._expr.all())
 
     async def ever(self, timeout: timedelta = seconds(10)) -> bool:
         """
         Returns True if the query succeeds at any point
         """
-        self._expr = self._expr.any()
+        # Build and validate the expression once, rather than on every sample
+        query = self.any().compile()
         async for _ in any_ready(self.trace, timeout=timeout):
-            if self._evaluate():
+            if query.evaluate():
                 return True
         return False
 
@@ -561,13 +622,42 @@ class Query:
         """
         Returns False if the query fails at any point
         """
-        self._expr = self._expr.all()
+        query = self.all().compile()
         async for _ in any_ready(self.trace, timeout=timeout):
-            if not self._evaluate():
+            if not query.evaluate():
                 return False
         return True
 
 
+class CompiledQuery:
+    """
+    A query whose expression has been checked against the trace's schema.
+
+    The checks only depend on the schema, so they're done once here instead of on
+    every evaluation.
+    """
+
+    def __init__(self, trace: Trace, expr: pl.Expr):
+        schema = pl.LazyFrame(schema=trace._schema).select(expr).collect_schema()
+
+        if len(schema) > 1:
+            raise ValueError("Query returned too many columns")
+
+        if schema.dtypes()[0] != pl.Boolean:
+            raise ValueError("Query returned non-boolean value(s)")
+
+        self.trace = trace
+        self.expr = expr
+
+    def evaluate(self) -> bool:
+        results = self.trace.to_polars().select(self.expr).to_series()
+
+        if len(results) != 1:
+            return bool(results.any())
+
+        return bool(results.item())
+
+
 async def ever(query: Query, timeout: timedelta = seconds(10)) -> bool:
     return await query.ever(timeout=timeout)
 
@@ -1,27 +1,32 @@
 """
 Pytest plugin providing a 'record' fixture for capturing data traces in tests, then
-generating interactive Altair plots. The plots are automatically attached to the pytest-html
-report for easy inspection of test-generated data.
+generating interactive Vega-Lite plots. The plots are automatically attached to the
+pytest-html report for easy inspection of test-generated data.
 
 This plugin leverages:
     - pytest-html for HTML report customization
-    - Altair for interactive chart generation
+    - Vega-Lite for interactive chart generation
     - Polars for efficient DataFrame handling
 
 References:
     - https://pytest-html.readthedocs.io/en/latest/api_reference.html
-    - https://altair-viz.github.io/
+    - https://vega.github.io/vega-lite/
     - The 'record' class is from hil.framework in this same package.
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor
+import json
 import logging
+import re
 import socket
-from datetime import datetime
+import traceback
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Generator, Protocol
+from urllib.parse import quote
 
-import altair as alt
 from hil.utils.config import ConfigDict, load_config, save_config
+import numpy as np
 import pathvalidate
 import polars as pl
 import pytest
@@ -35,6 +40,172 @@ logger = logging.getLogger(__name__)
 REPO_ROOT = Path(__file__).parent.parent.parent
 ARTIFACTS = REPO_ROOT / "artifacts"
 CHART_HEIGHT = 400
+CHART_TIME_FORMAT = "%Y-%m-%d %H:%M:%S.%L"
+# Traces with more samples than this are decimated before being embedded in charts
+CHART_MAX_SAMPLES_PER_TRACE = 5000
+
+# The chart is a fixed layering of the traces and the test's logs, so rather than
+# building (and validating) it through a plotting library for every test, we attach
+# the data to a static Vega-Lite spec. The layers refer to named datasets, so the
+# template itself is never modified and only needs a shallow copy per chart
+_VL_TEMPLATE = {
+    "$schema": "https://vega.github.io/schema/vega-lite/v5.20.1.json",
+    "config": {"view": {"continuousWidth": 300, "continuousHeight": 300}},
+    "width": "container",
+    "height": CHART_HEIGHT,
+    "params": [
+        {
+            "name": "zoom",
+            "select": {"type": "interval", "encodings": ["x", "y"]},
+            "bind": "scales",
+            "views": ["traces"],
+        }
+    ],
+    "layer": [
+        # Base trace chart: a line chart with points
+        {
+            "name": "traces",
+            "data": {"name": "trace_data"},
+            "mark": {"type": "line", "interpolate": "monotone", "point": True},
+            "encoding": {
+                "x": {
+                    "field": "timestamp",
+                    "type": "temporal",
+                    "title": "Time",
+                    "axis": {
+                        "format": CHART_TIME_FORMAT,
+                        "labelAngle": -45,
+                        "tickCount": 10,
+                        "tickMinStep": 0.01,
+                    },
+                },
+                "y": {"field": "value", "type": "quantitative"},
+                "color": {"field": "trace", "type": "nominal"},
+                "tooltip": [
+                    {"field": "timestamp", "type": "temporal", "title": "Time"},
+                    {"field": "trace", "type": "nominal", "title": "Trace"},
+                    {"field": "value", "type": "quantitative", "title": "Value"},
+                ],
+            },
+        },
+        # A subtle log layer, drawn as ticks with tooltips
+        {
+            "data": {"name": "log_data"},
+            "mark": {"type": "tick", "thickness": 6},
+            "encoding": {
+                "x": {"field": "timestamp", "type": "temporal", "title": "Time"},
+                "y": {"value": 0},
+                "color": {"field": "log_level", "type": "nominal", "title": "Level"},
+                "tooltip": [
+                    {"field": "log_level", "type": "nominal", "title": "Level"},
+                    {"field": "message", "type": "nominal", "title": "Message"},
+                    {
+                        "field": "timestamp",
+                        "type": "temporal",
+                        "format": CHART_TIME_FORMAT,
+                        "title": "Log Time",
+                    },
+                ],
+            },
+        },
+    ],
+}
+
+# Every chart is rendered by the same viewer page, which is written at the end of any
+# session that recorded traces. Specs are stored next to it as small scripts rather
+# than JSON, because browsers won't fetch() local files when the report is opened
+# from disk
+CHART_VIEWER_NAME = "viewer.html"
+CHART_SPEC_SUFFIX = ".vg.js"
+_IFRAME_TEMPLATE = (
+    f"<iframe style='width: 100%; height: {CHART_HEIGHT + 150}px; border: none;'"
+    " src='{src}'></iframe>"
+)
+_VIEWER_HTML = """<!DOCTYPE html>
+<html>
+<head>
+  <meta charset="UTF-8">
+  <style>
+    #vis.vega-embed {
+      width: 100%;
+      display: flex;
+    }
+  </style>
+  <script type="text/javascript" src="https://cdn.jsdelivr.net/npm/vega@5"></script>
+  <script type="text/javascript" src="https://cdn.jsdelivr.net/npm/vega-lite@5.20.1"></script>
+  <script type="text/javascript" src="https://cdn.jsdelivr.net/npm/vega-embed@6"></script>
+</head>
+<body>
+  <div id="vis"></div>
+  <script>
+    // Specs must be files next to the viewer, but may otherwise have any name
+    function isSpecName(name) {
+      return Boolean(name) && name.endsWith(".vg.js") &&
+        !name.includes("/") && !name.includes("\\\\") && !name.includes("..");
+    }
+    const name = new URLSearchParams(window.location.search).get("spec");
+    if (isSpecName(name)) {
+      const script = document.createElement("script");
+      script.src = encodeURIComponent(name);
+      script.onload = () =>
+        vegaEmbed("#vis", window.hilSpec, {"mode": "vega-lite"}).catch(console.error);
+      document.body.appendChild(script);
+    }
+  </script>
+</body>
+</html>
+"""
+
+
+def _decimate[F: (pl.DataFrame, pl.LazyFrame)](combined: F, max_samples: int) -> F:
+    """
+    Reduce long traces to at most `max_samples` points by splitting them into
+    buckets and keeping only the minimum and maximum sample of each, which
+    preserves the shape of the line. Shorter traces are left untouched.
+    """
+    index = pl.int_range(pl.len())
+    bucket = (index * (max_samples // 2) // pl.len()).over("trace")
+    is_extreme = (index == pl.col("value").arg_min()) | (
+        index == pl.col("value").arg_max()
+    )
+    return (
+        combined.with_columns(_bucket=bucket)
+        .filter(
+            (pl.len().over("trace") <= max_samples)
+            | is_extreme.over("trace", "_bucket")
+        )
+        .drop("_bucket")
+    )
+
+
+def _utc_offset(timestamp: float) -> np.timedelta64:
+    """Offset of local time from UTC at the given epoch time"""
+    offset = datetime.fromtimestamp(timestamp, timezone.utc).astimezone().utcoffset()
+    return np.timedelta64(offset, "us")
+
+
+def _local_datetimes(created: np.ndarray) -> np.ndarray:
+    """
+    Convert epoch seconds to naive local times, like datetime.fromtimestamp does, to
+    line up with trace timestamps. The whole array is shifted by one offset, unless
+    it spans a change in the offset (eg. DST), in which case each time gets its own.
+    """
+    local = (created * 1e6).astype("datetime64[us]")
+    if not len(created):
+        return local
+    offset = _utc_offset(created.min())
+    if offset == _utc_offset(created.max()):
+        return local + offset
+    return local + np.array([_utc_offset(t) for t in created], "timedelta64[us]")
+
+
+def _to_json_records(lf: pl.LazyFrame) -> list[dict]:
+    """Collect a frame as Vega-Lite data values, with ISO formatted timestamps"""
+    return (
+        lf.with_columns(pl.col("timestamp").dt.to_string("%Y-%m-%dT%H:%M:%S%.f"))
+        .collect()
+        .to_dicts()
+    )
 
 
 class _Config(Protocol):
@@ -43,6 +214,9 @@ class _Config(Protocol):
     """
 
     _hil_recorded_trace_paths: dict[str, Path]
+    _hil_chart_executor: ThreadPoolExecutor
+    _hil_chart_futures: dict[str, Future[None]]
+    _hil_chart_errors: dict[str, BaseException]
     rootdir: Path | str
 
     def addinivalue_line(self, name: str, line: str) -> None: ...
@@ -90,6 +264,13 @@ def pytest_configure(config: _Config):
     """
     config._hil_recorded_trace_paths = {}  # {node_id: Path}
 
+    # Charts are generated in the background, so tests don't wait on them
+    config._hil_chart_executor = ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="hil-charts"
+    )
+    config._hil_chart_futures = {}  # {node_id: Future}
+    config._hil_chart_errors = {}  # {node_id: exception}
+
     # Based on https://docs.pytest.org/en/stable/example/markers.html#custom-marker-and-command-line-option-to-control-test-runs
     config.addinivalue_line(
         "markers",
@@ -97,8 +278,45 @@ def pytest_configure(config: _Config):
     )
 
 
+def pytest_sessionfinish(session: pytest.Session):
+    config: _Config = session.config  # type: ignore
+    # Make sure every chart has been written before the session ends
+    config._hil_chart_executor.shutdown(wait=True)
+
+    # Write the shared chart viewer, only if there are charts for it to show
+    if config._hil_recorded_trace_paths:
+        ARTIFACTS.mkdir(parents=True, exist_ok=True)
+        (ARTIFACTS / CHART_VIEWER_NAME).write_text(_VIEWER_HTML, encoding="utf-8")
+
+    # Charts are written after their tests have finished, so collect any failures to
+    # report in the summary, and fail the run as a test error would have
+    config._hil_chart_errors = {
+        nodeid: exc
+        for nodeid, future in config._hil_chart_futures.items()
+        if (exc := future.exception()) is not None
+    }
+    if config._hil_chart_errors and session.exitstatus == pytest.ExitCode.OK:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(
+    terminalreporter: pytest.TerminalReporter, config: _Config
+) -> None:
+    if not config._hil_chart_errors:
+        return
+
+    terminalreporter.section("failed to save traces", red=True)
+    for nodeid, exc in config._hil_chart_errors.items():
+        terminalreporter.write_sep("_", nodeid, red=True)
+        terminalreporter.write("".join(traceback.format_exception(exc)))
+
+
+# The hostname can't change during a session, so look it up once rather than per test
+_LOCAL_HOSTNAME = socket.gethostname()
+
+
 def _should_runs_on(*, hostname: str | None = None) -> bool:
-    if hostname is not None and socket.gethostname() != hostname:
+    if hostname is not None and _LOCAL_HOSTNAME != hostname:
         return False
 
     return True
@@ -118,97 +336,98 @@ def _save_request_traces(
 ) -> None:
     """
     Save the traces for the given request by merging them into a single Polars DataFrame
-    and generating an Altair chart. If no data is found, returns None; otherwise, returns
-    the Path to the generated HTML chart.
+    and generating a Vega-Lite chart. The traces and logs are read here, in the test's
+    teardown, and only rendering and writing the chart is left to the background.
     """
     if not traces:
         return
 
-    # Convert each trace directly to long format and concatenate
-    combined = pl.concat(
-        [
-            pl.DataFrame(
-                {
-                    "timestamp": trace.timestamps,
-                    "trace": [trace.name] * len(trace.timestamps),
-                    "value": trace.data,
-                }
-            )
-            for trace in traces
-        ]
-    ).sort("timestamp")
-
-    logger.debug(combined)
+    frames = [trace.to_polars() for trace in traces]
+    lengths = [frame.height for frame in frames]
 
-    # If we have no data or only an empty frame, skip
-    if combined is None or combined.is_empty():
-        logger.debug(f"No data found for {request.node.nodeid}")
+    # If the traces didn't record any samples, skip before building anything else
+    if not sum(lengths):
+        logger.debug("No data found for %s", request.node.nodeid)
         return
 
-    # Base trace chart: a layered line chart with points
-    trace_layer = (
-        alt.Chart(combined)
-        .mark_line(point=True, interpolate="monotone")
-        .encode(
-            x=alt.X(
-                "timestamp:T",
-                title="Time",
-                axis=alt.Axis(
-                    format="%Y-%m-%d %H:%M:%S.%L",
-                    labelAngle=-45,
-                    tickCount=10,
-                    tickMinStep=0.01,
-                ),
+    # Build the long format frame from whole columns: each trace's samples are
+    # concatenated, and the trace names are gathered by index rather than building
+    # a list of names per trace. The rest of the processing is a lazy query, which is
+    # only collected once the chart data is needed
+    trace_ids = np.repeat(np.arange(len(traces)), lengths)
+    combined = pl.LazyFrame(
+        {
+            "timestamp": pl.concat(
+                [frame.get_column(Trace.TIMESTAMP_COLUMN) for frame in frames]
             ),
-            y="value:Q",
-            color="trace:N",
-            tooltip=[
-                alt.Tooltip("timestamp:T", title="Time"),
-                alt.Tooltip("trace:N", title="Trace"),
-                alt.Tooltip("value:Q", title="Value"),
-            ],
-        )
-    )
+            "trace": pl.Series([trace.name for trace in traces]).gather(trace_ids),
+            "value": pl.concat(
+                [frame.get_column(trace.name) for frame, trace in zip(frames, traces)]
+            ),
+        }
+    ).sort("timestamp")
 
-    # Convert log records to a list of dicts
-    log_data = pl.DataFrame(
+    # Convert log records to a frame. Their creation times are epoch seconds, which
+    # are converted to local time in one go
+    created = np.fromiter((log.created for log in logs), np.float64, len(logs))
+    log_data = pl.LazyFrame(
         {
-            "timestamp": [datetime.fromtimestamp(log.created) for log in logs],
-            "log_level": [log.levelname for log in logs],
-            "message": [log.getMessage() for log in logs],
+            "timestamp": _local_datetimes(created),
+            "log_level": pl.Series(
+                [log.levelname for log in logs], dtype=pl.Categorical
+            ),
+            "message": pl.Series([log.getMessage() for log in logs], dtype=pl.String),
         }
     )
 
-    # Create a subtle log layer using mark_rule.
-    # The rules are drawn as subtle, dashed vertical lines with tooltips.
-    log_layer = (
-        alt.Chart(log_data)
-        .mark_tick(thickness=6)
-        .encode(
-            x=alt.X("timestamp:T", title="Time"),
-            y=alt.value(0),
-            color=alt.Color("log_level:N", title="Level"),
-            tooltip=[
-                alt.Tooltip("log_level:N", title="Level"),
-                alt.Tooltip("message:N", title="Message"),
-                alt.Tooltip(
-                    "timestamp:T", format="%Y-%m-%d %H:%M:%S.%L", title="Log Time"
-                ),
-            ],
-        )
+    future = request.config._hil_chart_executor.submit(
+        _write_chart,
+        request.config._hil_recorded_trace_paths[request.node.nodeid],
+        request.node.nodeid,
+        combined,
+        log_data,
     )
+    request.config._hil_chart_futures[request.node.nodeid] = future
 
-    # Combine the two layers
-    final_chart = (
-        alt.layer(trace_layer, log_layer)
-        .properties(width="container", height=CHART_HEIGHT)
-        .interactive()
-    )
 
-    # Save the chart to the designated path
-    chart_path = request.config._hil_recorded_trace_paths[request.node.nodeid]
+def _write_chart(
+    chart_path: Path, title: str, combined: pl.LazyFrame, log_data: pl.LazyFrame
+) -> None:
+    """Render the chart spec for a test's traces and logs, and write it out"""
+    spec = {
+        **_VL_TEMPLATE,
+        "title": title,
+        "datasets": {
+            "trace_data": _to_json_records(
+                _decimate(combined, CHART_MAX_SAMPLES_PER_TRACE)
+            ),
+            "log_data": _to_json_records(log_data),
+        },
+    }
+
+    # Save the spec to the designated path, for the viewer to load
     chart_path.parent.mkdir(parents=True, exist_ok=True)
-    final_chart.save(chart_path)
+    chart_path.write_text(f"window.hilSpec = {json.dumps(spec)};\n", encoding="utf-8")
+
+
+# Path separators and "::" are dropped from node ids, and dots replaced, which is
+# enough to make a filename out of typical ids
+_NODEID_TRANS = str.maketrans({"/": None, ":": None, ".": "-"})
+_SAFE_FILENAME = re.compile(r"[\w\-\[\]]+")
+
+
+def _chart_url(chart_path: Path) -> str:
+    """URL of the viewer showing the given chart, relative to the artifacts directory"""
+    return f"./{CHART_VIEWER_NAME}?spec={quote(chart_path.name, safe='')}"
+
+
+def _sanitize_nodeid(nodeid: str) -> str:
+    """Turn a test's node id into a filename for its artifacts"""
+    sanitized = nodeid.translate(_NODEID_TRANS)
+    if _SAFE_FILENAME.fullmatch(sanitized):
+        return sanitized
+    # Let pathvalidate deal with anything unusual, eg. from parametrize ids
+    return pathvalidate.sanitize_filename(sanitized)
 
 
 @pytest.fixture(scope="function")
@@ -216,7 +435,7 @@ def record(request: _Request, caplog: pytest.LogCaptureFixture):
     """
     A pytest fixture that provides a callable, '_record', for creating and returning
     new hil.framework.record objects to capture time-series data in tests. The resulting
-    traces are later turned into Altair charts for inclusion in the pytest-html report.
+    traces are later turned into Vega-Lite charts for inclusion in the pytest-html report.
 
     Example:
     ----------------------------------------------------------------
@@ -227,6 +446,9 @@ def record(request: _Request, caplog: pytest.LogCaptureFixture):
     ----------------------------------------------------------------
     """
     traces: list[Trace] = []
+    chart_path = (
+        ARTIFACTS / f"{_sanitize_nodeid(request.node.nodeid)}{CHART_SPEC_SUFFIX}"
+    )
 
     class _record(hil_record):
         @classmethod
@@ -235,19 +457,12 @@ def record(request: _Request, caplog: pytest.LogCaptureFixture):
 
             # This is in a bit of a weird spot because it needs to be called before the
             # report is generated, but this fixture's cleanup is called afterwards
-            sanitized_nodeid = (
-                pathvalidate.sanitize_filename(request.node.nodeid)
-                .replace(":", "-")
-                .replace("/", "-")
-                .replace(".", "-")
-            )
-            chart_path = ARTIFACTS / f"{sanitized_nodeid}.html"
             request.config._hil_recorded_trace_paths[request.node.nodeid] = chart_path
 
     try:
         yield _record
     finally:
-        logger.debug(f"Saving {traces} traces for {request.node.nodeid}")
+        logger.debug("Saving %d traces for %s", len(traces), request.node.nodeid)
         _save_request_traces(request, traces, caplog.get_records(when="call"))
 
 
@@ -263,15 +478,10 @@ def pytest_runtest_makereport(item: _Item, call: pytest.CallInfo):
     if call.when == "call" and (
         trace_chart_path := item.config._hil_recorded_trace_paths.get(item.nodeid)
     ):
-        # Append the chart HTML to the report extras
-        report.extras.append(
-            html_extras.url(f"./{trace_chart_path.name}", name="Traces")
-        )
-        report.extras.append(
-            html_extras.html(
-                f"<iframe style='width: 100%; height: {CHART_HEIGHT + 150}px; border: none;' src='./{trace_chart_path.name}'></iframe>"
-            )
-        )
+        # Append the chart viewer to the report extras
+        chart_url = _chart_url(trace_chart_path)
+        report.extras.append(html_extras.url(chart_url, name="Traces"))
+        report.extras.append(html_extras.html(_IFRAME_TEMPLATE.format(src=chart_url)))
 
 
 @pytest.fixture(scope="session")
@@ -287,7 +497,7 @@ def machine_config(request: _Request) -> Generator[ConfigDict, None, None]:
     configs_dir = request.config.getini("hil_configs_dir")
     configs_path = Path(str(configs_dir) if configs_dir else default_configs_dir)
 
-    pet_name = socket.gethostname()
+    pet_name = _LOCAL_HOSTNAME
     config_obj = load_config(Path(request.config.rootdir) / configs_path, pet_name)
     try:
         yield config_obj
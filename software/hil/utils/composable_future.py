@@ -13,6 +13,16 @@ from typing import Awaitable, Callable, Concatenate, ParamSpec, Self
 import warnings
 
 
+def _to_thread[R](func: Callable[[], R]) -> Awaitable[R]:
+    """Run func in the event loop's default executor.
+
+    Unlike asyncio.to_thread, this doesn't copy the caller's context into the
+    thread, which saves wrapping every dispatch. Operations shouldn't rely on
+    context variables.
+    """
+    return asyncio.get_running_loop().run_in_executor(None, func)
+
+
 class Future[T](collections.abc.Awaitable):
     """A composable Future that allows chaining of operations for asynchronous execution.
 
@@ -43,11 +53,11 @@ class Future[T](collections.abc.Awaitable):
         """
 
         def _execute():
-            results = tuple(operation() for operation in self._operations)
+            results = tuple([operation() for operation in self._operations])
             self._operations.clear()
             return results
 
-        return await asyncio.to_thread(_execute)
+        return await _to_thread(_execute)
 
     async def execute(self) -> T:
         """Execute all operations and return the result of the last operation.
@@ -59,17 +69,19 @@ class Future[T](collections.abc.Awaitable):
             T: The result of the last operation in the chain.
         """
 
-        def _execute():
-            for operation in self._operations[:-1]:
-                operation()
-
-            if last_op := self._operations[-1:]:
-                result = last_op[0]()
+        return await _to_thread(self._run)
 
-            self._operations.clear()
-            return result
+    def _run(self) -> T:
+        """Run all operations in the calling thread, returning the last result."""
+        operations = self._operations
+        result = None
+        if n := len(operations):
+            for i in range(n - 1):
+                operations[i]()
+            result = operations[n - 1]()
 
-        return await asyncio.to_thread(_execute)
+        operations.clear()
+        return result  # type: ignore
 
     def __await__(self):
         """Make the Future awaitable.
@@ -91,6 +103,27 @@ class Future[T](collections.abc.Awaitable):
             )
 
 
+async def gather(*futures: Future) -> tuple:
+    """Execute several Futures in a single trip to a worker thread.
+
+    Each Future's operations run in order, one Future after another, which saves
+    a thread dispatch per Future compared to awaiting them separately.
+
+    Returns:
+        tuple: The result of each Future's last operation, in the order given.
+
+    Example:
+        ```python
+        a, b = await gather(future_a.step1(), future_b.step2())
+        ```
+    """
+
+    def _execute():
+        return tuple([future._run() for future in futures])
+
+    return await _to_thread(_execute)
+
+
 P = ParamSpec("P")
 
 
@@ -131,7 +164,7 @@ def composable[T, S: Self](
 
     @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
-        self._operations.append(lambda: func(self, *args, **kwargs))
+        self._operations.append(functools.partial(func, self, *args, **kwargs))
         return self
 
     return wrapper
@@ -13,83 +13,124 @@ class ConfigDict(defaultdict):
 
     def __init__(self, *args, **kwargs):
         super().__init__(ConfigDict, *args, **kwargs)
-        self._touched = set()
+        # Track the keys that haven't been used yet, rather than those that have, so
+        # that it's the set to remove on clean and only shrinks as keys are read
+        self._untouched = set(self.keys())
 
     @classmethod
     def from_dict(cls, data: dict):
         self = cls(
             {
-                str(k): ConfigDict.from_dict(v) if isinstance(v, dict) else v
+                # Most keys are already strings, so skip the conversion for those
+                (k if type(k) is str else str(k)): (
+                    ConfigDict.from_dict(v) if isinstance(v, dict) else v
+                )
                 for k, v in data.items()
             }
         )
         return self
 
+    @classmethod
+    def _from_json(cls, data: dict) -> Self:
+        """
+        Hook for json.load to build ConfigDicts while parsing. Sections are marked as
+        touched, as they would be when merged in with nested_update.
+        """
+        self = cls(data)
+        self._untouched.difference_update(
+            k for k, v in data.items() if isinstance(v, ConfigDict)
+        )
+        return self
+
     def nested_update(self, other: dict, touch=False) -> Self:
         for k, v in other.items():
-            k = str(k)
+            if type(k) is not str:
+                k = str(k)
             if isinstance(v, dict):
                 self_v = self[k]
                 if isinstance(self_v, ConfigDict):
                     self_v.nested_update(v)
                 else:
                     logger.warning(f"Overriding non-ConfigDict value for key {k}")
-                    # Use super to avoid marking these items as touched
-                    if touch:
-                        self[k] = ConfigDict.from_dict(v)
-                    else:
-                        super().__setitem__(k, ConfigDict.from_dict(v))
+                    # The key was just read, so it's touched either way
+                    self[k] = ConfigDict.from_dict(v)
             else:
-                # Use super to avoid marking these items as touched
                 if touch:
                     self[k] = v
                 else:
-                    super().__setitem__(k, v)
+                    self._set_untouched(k, v)
+        return self
+
+    def nested_setdefault(self, other: dict, touch=False) -> Self:
+        """Recursively fill in any items from `other` that aren't already set"""
+        for k, v in other.items():
+            if type(k) is not str:
+                k = str(k)
+            if isinstance(v, dict):
+                self_v = self[k]
+                if isinstance(self_v, ConfigDict):
+                    self_v.nested_setdefault(v)
+            elif touch:
+                if k in self:
+                    self._touch(k)
+                else:
+                    self[k] = v
+            elif k not in self:
+                self._set_untouched(k, v)
         return self
 
     def __getitem__(self, key):
-        # The JSON module will stringify keys regardless
-        key = str(key)
+        # The JSON module will stringify keys regardless. Keys are nearly always
+        # strings already, so only convert the ones that aren't
+        if type(key) is not str:
+            key = str(key)
         self._touch(key)
         return super().__getitem__(key)
 
     def __setitem__(self, key, value):
-        key = str(key)
+        if type(key) is not str:
+            key = str(key)
         self._touch(key)
         super().__setitem__(key, value)
 
     def _touch(self, key):
-        self._touched.add(key)
+        self._untouched.discard(key)
+
+    def _set_untouched(self, key, value):
+        """Set an item without marking it as touched"""
+        if key not in self:
+            self._untouched.add(key)
+        super().__setitem__(key, value)
 
     def clean(self):
         """Recursively clean the dict and any sub-dicts of un-read items"""
-        for key in list(self.keys()):
-            if key in self._touched:
-                value = self[key]
-                if isinstance(value, ConfigDict):
-                    value.clean()
-            else:
-                del self[key]
+        for key in self._untouched:
+            self.pop(key, None)
+        self._untouched.clear()
+
+        for value in self.values():
+            if isinstance(value, ConfigDict):
+                value.clean()
 
 
 def load_config(configs_dir: Path, pet_name: str) -> ConfigDict:
     path = configs_dir / f"{pet_name}.json"
     if path.is_file():
-        with open(path, "r") as f:
-            try:
-                return (
-                    ConfigDict()
-                    .nested_update(ConfigDict.DEFAULTS, touch=True)
-                    .nested_update(json.load(f), touch=False)
-                )
-            except Exception as e:
-                logger.exception(f"Error loading config from {path}: {e}")
+        try:
+            # Read the file in one go, and fill the defaults into the loaded config
+            # rather than merging the (typically much larger) loaded config into them
+            return json.loads(
+                path.read_bytes(), object_hook=ConfigDict._from_json
+            ).nested_setdefault(ConfigDict.DEFAULTS, touch=True)
+        except Exception as e:
+            logger.exception(f"Error loading config from {path}: {e}")
 
-    return ConfigDict().nested_update(ConfigDict.DEFAULTS, touch=True)
+    return ConfigDict().nested_setdefault(ConfigDict.DEFAULTS, touch=True)
 
 
 def save_config(config: ConfigDict, configs_dir: Path, pet_name: str):
     config_path = configs_dir / f"{pet_name}.json"
     config_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(config_path, "w") as f:
-        json.dump(config, f)
+    # Serialise in one call and write the result at once, rather than letting
+    # json.dump write each chunk of the encoding to the file
+    config_path.write_text(json.dumps(config), encoding="utf-8")
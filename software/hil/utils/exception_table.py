@@ -1,14 +1,24 @@
 import asyncio
 from contextlib import contextmanager
 import logging
-from typing import Any, ContextManager, Generator, Iterable, Sequence
+from typing import Any, Awaitable, ContextManager, Generator, Iterable, Sequence
 
 from rich.console import Console
+from rich.style import Style
 from rich.table import Table
 from rich.text import Text
 
 logger = logging.getLogger(__name__)
 
+# Cells are truncated to this many characters
+_MAX_CELL_LENGTH = 10
+# Styles are built once, rather than parsed from a string for every cell
+_STYLE = Style(color="green")
+_EXCEPTION_STYLE = Style(color="red")
+# Shared, since creating a console probes the terminal. It writes to whatever
+# sys.stdout is at the time of printing
+_CONSOLE = Console(color_system="256")
+
 
 class ExceptionTable:
     def __init__(
@@ -32,31 +42,59 @@ class ExceptionTable:
         return self._finalized
 
     def _style(self, obj) -> Text:
+        # Cancellation errors have no message of their own
+        if isinstance(obj, asyncio.CancelledError):
+            return Text("Cancelled", style=_EXCEPTION_STYLE)
         # Shorten long strings and assign a style based on the type of object.
-        str_val = str(obj)
-        if len(str_val) > 10:
-            str_val = str_val[:9] + "."
-        if isinstance(obj, Exception):
-            return Text(str_val, style="red")
-        return Text(str_val, style="green")
+        str_val = obj if type(obj) is str else str(obj)
+        if len(str_val) > _MAX_CELL_LENGTH:
+            str_val = str_val[: _MAX_CELL_LENGTH - 1] + "."
+        return Text(
+            str_val, style=_EXCEPTION_STYLE if isinstance(obj, Exception) else _STYLE
+        )
 
     def add_row(self, name: str, *row: Any):
-        self.table.add_row(name, *[self._style(cell) for cell in row])
+        self.table.add_row(name, *map(self._style, row))
         self._exceptions.extend([cell for cell in row if isinstance(cell, Exception)])
 
-    async def gather_row(self, *coro_or_future, name: str):
+    async def gather_row(self, *coro_or_future, name: str, fail_fast: bool = False):
         """
         Awaits the provided coroutines or futures using asyncio.gather.
         Records the results along with the provided name and returns them.
+
+        With fail_fast, the first exception cancels the remaining awaitables, which
+        are recorded as asyncio.CancelledError instances.
         """
         if self.finalized:
             raise RuntimeError("Cannot call 'gather' on a finalized ExceptionTable.")
 
-        results = await asyncio.gather(*coro_or_future, return_exceptions=True)
+        if fail_fast:
+            results = await self._gather_fail_fast(coro_or_future)
+        else:
+            results = await asyncio.gather(*coro_or_future, return_exceptions=True)
         self.add_row(name, *results)
 
         return results
 
+    @staticmethod
+    async def _gather_fail_fast(aws: Iterable[Awaitable]) -> list:
+        async def _await(aw: Awaitable):
+            return await aw
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(_await(aw)) for aw in aws]
+        except* Exception:
+            # The exceptions are collected from the tasks below
+            pass
+
+        return [
+            asyncio.CancelledError()
+            if task.cancelled()
+            else task.exception() or task.result()
+            for task in tasks
+        ]
+
     def iter_row[T](
         self, name: str, columns: Iterable[T]
     ) -> Generator[tuple[ContextManager, T], None, None]:
@@ -82,7 +120,7 @@ class ExceptionTable:
 
     def print_table(self):
         # FIXME: better color formatting
-        Console(color_system="256").print("\n", self.table)
+        _CONSOLE.print("\n", self.table)
 
     @property
     def exceptions(self) -> list[Exception]:
@@ -1,8 +1,8 @@
-import uuid
+import functools
 import hashlib
+import uuid
 
-
-ADJECTIVES = [
+ADJECTIVES = (
     "happy",
     "sleepy",
     "grumpy",
@@ -43,9 +43,9 @@ ADJECTIVES = [
     "zesty",
     "loopy",
     "fuzzy",
-]
+)
 
-ANIMALS = [
+ANIMALS = (
     "panda",
     "otter",
     "penguin",
@@ -78,16 +78,28 @@ ANIMALS = [
     "pangolin",
     "axolotl",
     "ferret",
-]
+)
+
+_N_ADJECTIVES = len(ADJECTIVES)
+_N_ANIMALS = len(ANIMALS)
+# For checking names without scanning the word lists
+_ADJECTIVE_SET = frozenset(ADJECTIVES)
+_ANIMAL_SET = frozenset(ANIMALS)
 
 
 def looks_like_a_pet_name(name: str) -> bool:
-    try:
-        adjective, animal = name.split("-")
-    except ValueError:
+    adjective, sep, animal = name.partition("-")
+    if not sep or "-" in animal:
         return False
 
-    return adjective in ADJECTIVES and animal in ANIMALS
+    return adjective in _ADJECTIVE_SET and animal in _ANIMAL_SET
+
+
+@functools.cache
+def _default_identifier() -> int:
+    # Looking up the MAC can mean reading network interfaces or running a subprocess,
+    # and it won't change while we're running
+    return uuid.getnode()
 
 
 def get_pet_name(identifier: int | None = None) -> str:
@@ -97,12 +109,18 @@ def get_pet_name(identifier: int | None = None) -> str:
 
     Example:
         >>> get_pet_name(0x001A2B3C4D5E)
-        'chunky-otter'
+        'cute-platypus'
     """
     if identifier is None:
-        identifier = uuid.getnode()
+        identifier = _default_identifier()
+
+    return _pet_name(identifier)
+
 
-    # MACs aren't evenly distributed, so we hash them to get a more even distribution
+@functools.lru_cache(maxsize=4096)
+def _pet_name(identifier: int) -> str:
+    # MACs aren't evenly distributed, so we hash them to get a more even distribution.
+    # Names identify machines elsewhere (eg. hostnames), so this mapping must not change
     hashed = hashlib.md5(identifier.to_bytes(6)).digest()
 
     # Extract first 3 bytes for adjective (24 bits)
@@ -111,7 +129,7 @@ def get_pet_name(identifier: int | None = None) -> str:
     animal_hash = int.from_bytes(hashed[-3:])
 
     # Select deterministic names using modulo
-    adjective = ADJECTIVES[adj_hash % len(ADJECTIVES)]
-    animal = ANIMALS[animal_hash % len(ANIMALS)]
+    adjective = ADJECTIVES[adj_hash % _N_ADJECTIVES]
+    animal = ANIMALS[animal_hash % _N_ANIMALS]
 
     return f"{adjective}-{animal}"
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Sequence
 
@@ -23,17 +24,16 @@ class CellSim:
 
     @classmethod
     async def create(cls, bus: AsyncSMBus, config: ConfigDict):
+        """Create the CellSim's devices. The bus must already be open."""
         self = cls()
-        # Open the bus before creating devices
-        async with bus:
-            self._mux = TCA9548A(bus)
-            self._branch_buses = AsyncSMBusBranch.from_channels(
-                bus, self._mux, list(range(0, 8))
-            )
-            self.cells = [
-                await Cell.create(i, bus, config[i])
-                for i, bus in enumerate(self._branch_buses)
-            ]
+        self._mux = TCA9548A(bus)
+        self._branch_buses = AsyncSMBusBranch.from_channels(
+            bus, self._mux, list(range(0, 8))
+        )
+        self.cells = [
+            await Cell.create(i, bus, config[i])
+            for i, bus in enumerate(self._branch_buses)
+        ]
         return self
 
 
@@ -47,20 +47,23 @@ class Hil:
     config: ConfigDict
 
     @classmethod
-    async def create(cls, config: ConfigDict):
+    async def create(cls, physical_bus: AsyncSMBus, config: ConfigDict):
+        """Create the HIL's devices. The bus must already be open."""
         self = cls()
         self.config = config
-        self.physical_bus = AsyncSMBusPeripheral(1)
-        # Open the bus before creating CellSim
-        async with self.physical_bus:
-            self.cellsim = await CellSim.create(
-                self.physical_bus, self.config["cellsim"]
-            )
+        self.physical_bus = physical_bus
+        self.cellsim = await CellSim.create(self.physical_bus, self.config["cellsim"])
         return self
 
     async def aclose(self):
-        for cell in self.cellsim.cells:
-            await cell.aclose()
+        # The cells sit behind a shared mux which serialises their bus access, so
+        # they can be returned to a safe state concurrently. Every cell is waited on,
+        # even if others fail, so none are left mid-teardown
+        results = await asyncio.gather(
+            *(cell.aclose() for cell in self.cellsim.cells), return_exceptions=True
+        )
+        if exceptions := [r for r in results if isinstance(r, Exception)]:
+            raise ExceptionGroup("Failed to close cells", exceptions)
 
     async def __aenter__(self):
         return self
@@ -71,8 +74,6 @@ class Hil:
 
 @pytest.fixture(scope="session")
 async def hil(machine_config: ConfigDict):
-    # Create HIL instance
-    hil = await Hil.create(machine_config)
-    # Open bus for the duration of the test session
-    async with hil.physical_bus:
-        yield hil
+    # Open the bus once, for both setting up the devices and the rest of the session
+    async with AsyncSMBusPeripheral(1) as physical_bus:
+        yield await Hil.create(physical_bus, machine_config)
@@ -11,31 +11,46 @@ import pytest
 
 logger = logging.getLogger(__name__)
 
+# Voltage points from 0.5V to 4.1V in 0.1V steps
+VOLTAGES = tuple(v / 10 for v in range(5, 42))
+# Buck voltage points from 1.5V to 4.4V in 0.1V steps
+BUCK_VOLTAGES = tuple(v / 10 for v in range(15, 45))
+
 if TYPE_CHECKING:
+    from hil.drivers.cell import Cell
+
     from ..conftest import Hil
 
 
 @pytest.mark.runs_on(hostname="chunky-otter")
 async def test_performance(hil: "Hil"):
+    # Each cell's steps run in order, but the cells are driven concurrently
+    async def _setup(cell: "Cell"):
+        await cell.reset()
+        await cell.set_voltage(1)
+
+    async def _start(cell: "Cell"):
+        await cell.enable()
+        await cell.turn_off_output_relay()
+        await cell.close_load_switch()
+
+    async def _stop(cell: "Cell"):
+        await cell.open_load_switch()
+        await cell.disable()
+
     async with hil:
-        for cell in hil.cellsim.cells:
-            await cell.reset()
-            await cell.set_voltage(1)
+        cells = hil.cellsim.cells
+        await asyncio.gather(*[_setup(cell) for cell in cells])
 
         for _ in range(10):
-            for cell in hil.cellsim.cells:
-                await cell.enable()
-                await cell.turn_off_output_relay()
-                await cell.close_load_switch()
+            await asyncio.gather(*[_start(cell) for cell in cells])
 
             await asyncio.gather(
-                *[cell.get_voltage() for cell in hil.cellsim.cells],
-                *[cell.get_current() for cell in hil.cellsim.cells],
+                *[cell.get_voltage() for cell in cells],
+                *[cell.get_current() for cell in cells],
             )
 
-            for cell in hil.cellsim.cells:
-                await cell.open_load_switch()
-                await cell.disable()
+            await asyncio.gather(*[_stop(cell) for cell in cells])
 
 
 @pytest.mark.runs_on(hostname="chunky-otter")
@@ -46,8 +61,6 @@ async def test_output_voltage(hil: "Hil", record: Recorder):
         - Measure output voltage
         - Check voltage within 0.02V
     """
-    # Generate voltage points from 0.5V to 4.3V in 0.1V steps
-    VOLTAGES = [v / 10 for v in range(5, 42)]
     cells = hil.cellsim.cells
     async with hil:
         # Set up the cell
@@ -106,7 +119,6 @@ async def test_buck_voltage(hil: "Hil", record: Recorder):
         - Measure buck voltage
         - Check voltage within 0.1V
     """
-    BUCK_VOLTAGES = [v / 10 for v in range(15, 45)]
     cells = hil.cellsim.cells
 
     async with hil:
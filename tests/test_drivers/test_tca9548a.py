@@ -0,0 +1,32 @@
+import pytest
+
+from hil.drivers.tca9548a import TCA9548A
+
+
+class _Handle:
+    def __init__(self):
+        self.writes = []
+        self.fail = False
+
+    async def write_byte(self, address: int, value: int):
+        if self.fail:
+            raise OSError("write failed")
+        self.writes.append((address, value))
+
+
+async def test_set_mux_skips_redundant_writes():
+    mux = TCA9548A(bus=None)  # type: ignore
+    handle = _Handle()
+
+    await mux.set_mux(1, handle)  # type: ignore
+    await mux.set_mux(1, handle)  # type: ignore
+    await mux.set_mux(2, handle)  # type: ignore
+    assert handle.writes == [(0x70, 0b010), (0x70, 0b100)]
+
+    # A failed write means the channel has to be selected again
+    handle.fail = True
+    with pytest.raises(OSError):
+        await mux.set_mux(3, handle)  # type: ignore
+    handle.fail = False
+    await mux.set_mux(2, handle)  # type: ignore
+    assert handle.writes[-1] == (0x70, 0b100)
@@ -1,5 +1,6 @@
 import asyncio
 import collections.abc
+from datetime import timedelta
 import pytest
 
 from hil.framework import any_ready
@@ -82,3 +83,16 @@ async def test_any_early_stop():
             break
 
     assert len(results) == 3
+
+
+async def test_any_timeout():
+    """Test that any_ready stops yielding once the timeout has passed."""
+    results = []
+    async for _ in any_ready(
+        async_iter([1] * 5),
+        async_iter([1000]),
+        timeout=timedelta(milliseconds=100),
+    ):
+        results.append(len(results))
+
+    assert len(results) == 5
@@ -0,0 +1,38 @@
+import pytest
+
+from hil.framework import Query, Trace
+
+
+def test_query_operators_do_not_mutate():
+    trace = Trace[float]("test")
+    for value in [1.0, 2.0, 3.0]:
+        trace.append(value)
+
+    query = Query(trace)
+    above = query > 2.5
+    below = query < 1.5
+
+    assert above is not query
+    assert below is not query
+    assert bool(above.any())
+    assert bool(below.any())
+    assert not bool(above.all())
+    # The original query is unchanged and still selects the raw values
+    assert trace.to_polars().select(query._expr).to_series().to_list() == [
+        1.0,
+        2.0,
+        3.0,
+    ]
+
+
+def test_compiled_query_validates_schema_once():
+    trace = Trace[float]("test")
+
+    with pytest.raises(ValueError, match="non-boolean"):
+        Query(trace).compile()
+
+    compiled = (Query(trace) > 1.5).any().compile()
+    trace.append(1.0)
+    assert not compiled.evaluate()
+    trace.append(2.0)
+    assert compiled.evaluate()
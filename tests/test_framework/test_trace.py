@@ -0,0 +1,46 @@
+from datetime import datetime
+
+from hil.framework import Trace, seconds
+
+
+def test_trace_duration():
+    start = datetime(2025, 1, 1)
+    trace = Trace[float]("test")
+    trace.append(1.0, start + seconds(1))
+    trace.append(2.0, start)
+    trace.append(3.0, start + seconds(3))
+    assert trace.duration == seconds(3)
+    assert trace.duration_s == 3.0
+
+    # Derived traces compute their duration from the data instead
+    derived = trace.derive(trace.to_polars().head(2))
+    assert derived.duration == seconds(1)
+
+
+def test_trace_buffers_grow():
+    start = datetime(2025, 1, 1)
+    trace = Trace[float]("test")
+    n = 3 * Trace.INITIAL_CAPACITY
+    for i in range(n):
+        trace.append(float(i), start + seconds(i))
+
+    df = trace.to_polars()
+    assert df.get_column("test").to_list() == [float(i) for i in range(n)]
+    assert df.get_column(Trace.TIMESTAMP_COLUMN)[-1] == start + seconds(n - 1)
+
+    # Samples appended after a conversion are added to the existing frame
+    trace.append(-1.0, start)
+    assert trace.to_polars().height == n + 1
+    assert df.height == n
+
+
+def test_trace_missing_samples_are_null():
+    start = datetime(2025, 1, 1)
+    trace = Trace[float | None]("test")
+    for i, value in enumerate([1.0, None, 2.0, float("nan")]):
+        trace.append(value, start + seconds(i))
+
+    values = trace.to_polars().get_column("test")
+    assert values.is_null().to_list() == [False, True, False, False]
+    # Only NaN values read as NaN, not missing ones
+    assert values.is_nan().to_list() == [False, None, False, True]
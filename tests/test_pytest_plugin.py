@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta
+import json
+from pathlib import Path
+import re
+import shutil
+import subprocess
+import time
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+import polars as pl
+import pytest
+
+from hil.pytest_plugin import (
+    _VIEWER_HTML,
+    CHART_SPEC_SUFFIX,
+    _chart_url,
+    _decimate,
+    _local_datetimes,
+    _sanitize_nodeid,
+)
+
+
+def test_decimate_long_traces():
+    n = 10_000
+    start = datetime(2025, 1, 1)
+    combined = pl.DataFrame(
+        {
+            "timestamp": [start + timedelta(milliseconds=i) for i in range(n)] * 2,
+            "trace": ["sine"] * n + ["flat"] * n,
+            "value": np.concatenate([np.sin(np.arange(n) / 100), np.ones(n)]),
+        }
+    ).sort("timestamp")
+
+    decimated = _decimate(combined, max_samples=1000)
+    lengths = dict(decimated.group_by("trace").len().iter_rows())
+    assert lengths["sine"] == 1000
+    # Flat traces have a single extreme per bucket
+    assert lengths["flat"] == 500
+
+    # The extremes of each trace survive
+    assert decimated["value"].max() == combined["value"].max()
+    assert decimated["value"].min() == combined["value"].min()
+
+    # Traces within the limit are left untouched
+    assert _decimate(combined, max_samples=n).equals(combined)
+
+
+def test_sanitize_nodeid():
+    assert _sanitize_nodeid("tests/test_a.py::test_b") == "teststest_a-pytest_b"
+    assert _sanitize_nodeid("tests/a.py::T::test_c[1-2]") == "testsa-pyTtest_c[1-2]"
+    # Unusual characters are handled by pathvalidate
+    assert _sanitize_nodeid("tests/a.py::test_d[<x>]") == "testsa-pytest_d[x]"
+
+
+def test_local_datetimes_across_dst(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("TZ", "Europe/London")
+    time.tzset()
+    try:
+        # An hour either side of the clocks going forward on 2025-03-30
+        created = np.arange(1743292800, 1743300000, 600, dtype=np.float64)
+        expected = [datetime.fromtimestamp(t) for t in created]
+        assert _local_datetimes(created).tolist() == expected
+        assert _local_datetimes(created[:3]).tolist() == expected[:3]
+    finally:
+        monkeypatch.undo()
+        time.tzset()
+
+
+def test_chart_url_round_trip():
+    name = _sanitize_nodeid("tests/a.py::test_e[0-5+1 #&]") + CHART_SPEC_SUFFIX
+    url = _chart_url(Path("artifacts") / name)
+    # Parsing the query gives back the name, like URLSearchParams in the viewer
+    assert parse_qs(urlsplit(url).query)["spec"] == [name]
+
+    node = shutil.which("node")
+    if node is None:
+        pytest.skip("node isn't available to run the viewer's check")
+    is_spec_name = re.search(r"function isSpecName.*?\n    }", _VIEWER_HTML, re.S)
+    assert is_spec_name is not None
+    script = (
+        f"{is_spec_name.group()}\n"
+        f"const query = {json.dumps(urlsplit(url).query)};\n"
+        "const name = new URLSearchParams(query).get('spec');\n"
+        "console.log(JSON.stringify([name, isSpecName(name), isSpecName('../x.vg.js')]));"
+    )
+    result = subprocess.run(
+        [node, "-e", script], capture_output=True, text=True, check=True
+    )
+    assert json.loads(result.stdout) == [name, True, False]
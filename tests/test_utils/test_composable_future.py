@@ -1,4 +1,4 @@
-from hil.utils.composable_future import Future, composable
+from hil.utils.composable_future import Future, composable, gather
 
 
 class Demo[T](Future[T]):
@@ -20,3 +20,17 @@ async def test_composable_future():
     r2 = await query.operation1(1, list_).operation2("2", list_)
     assert list_ == [1, "2"]
     assert r2 == "2"
+
+
+async def test_empty_future():
+    assert await Demo() is None
+
+
+async def test_gather():
+    list_ = []
+    results = await gather(
+        Demo().operation1(1, list_).operation2("2", list_),
+        Demo().operation2("3", list_),
+    )
+    assert list_ == [1, "2", "3"]
+    assert results == ("2", "3")
@@ -162,3 +162,33 @@ def test_configdict_setdefault():
     assert config.setdefault("dict", {"a": 1}) == {"a": 1}
     assert config.setdefault("string", "test") == "test"
     assert config.setdefault("number", 42) == 42
+
+
+def test_load_config_clean(tmp_path: Path):
+    save_config(
+        ConfigDict.from_dict({"a": {"used": 1, "unused": 2}, "b": {"c": {"d": 3}}}),
+        tmp_path,
+        "test_pet",
+    )
+
+    config = load_config(tmp_path, "test_pet")
+    assert isinstance(config["b"]["c"], ConfigDict)
+    assert config["a"]["used"] == 1
+    config.clean()
+
+    # Only unread values are removed, the sections they were in are kept
+    assert config["a"] == {"used": 1}
+    assert config["b"] == {"c": {}}
+
+
+def test_configdict_nested_setdefault():
+    config = ConfigDict.from_dict({"a": {"b": 1}, "c": 2})
+    config.nested_setdefault({"a": {"b": 3, "d": 4}, "c": 5, "e": 6})
+    assert config == {"a": {"b": 1, "d": 4}, "c": 2, "e": 6}
+
+
+def test_configdict_nested_update_copies():
+    other = ConfigDict.from_dict({"a": {"b": 1}})
+    config = ConfigDict().nested_update(other)
+    config["a"]["b"] = 2
+    assert other["a"]["b"] == 1
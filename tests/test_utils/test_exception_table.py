@@ -1,3 +1,5 @@
+import asyncio
+
 from hil.utils.exception_table import ExceptionTable
 import pytest
 
@@ -62,3 +64,24 @@ def test_iter_row_incomplete():
 
     table.finalize()  # Should log a warning about missing columns
     assert table.table.row_count == 1
+
+
+async def test_gather_row_fail_fast():
+    async def fail():
+        raise ValueError("Test exception")
+
+    async def hang():
+        await asyncio.sleep(10)
+
+    async def totally_fine():
+        return "totally fine"
+
+    table = ExceptionTable(["fail", "hang", "totally fine"])
+    results = await table.gather_row(
+        fail(), hang(), totally_fine(), name="row", fail_fast=True
+    )
+    assert isinstance(results[0], ValueError)
+    assert isinstance(results[1], asyncio.CancelledError)
+    assert results[2] == "totally fine"
+    assert table.exceptions == [results[0]]
+    assert table._style(results[1]).style == table._style(results[0]).style
@@ -1,4 +1,4 @@
-from hil.utils.pet_name import get_pet_name
+from hil.utils.pet_name import get_pet_name, looks_like_a_pet_name
 
 
 def test_get_pet_name_deterministic():
@@ -15,6 +15,11 @@ def test_get_pet_name_deterministic():
     assert len(animal) > 0
 
 
+def test_get_pet_name_stable():
+    # Names are used as hostnames, so the mapping must not change
+    assert get_pet_name(0x001A2B3C4D5E) == "cute-platypus"
+
+
 def test_get_pet_name_different_inputs():
     # Test that different inputs produce different outputs
     name1 = get_pet_name(0x111111111111)
@@ -27,3 +32,10 @@ def test_get_pet_name_no_input():
     name = get_pet_name()
     assert isinstance(name, str)
     assert "-" in name
+
+
+def test_looks_like_a_pet_name():
+    assert looks_like_a_pet_name(get_pet_name(0x123456789ABC))
+    assert not looks_like_a_pet_name("happy")
+    assert not looks_like_a_pet_name("happy-panda-otter")
+    assert not looks_like_a_pet_name("happy-computer")